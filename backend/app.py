@@ -1,95 +1,539 @@
-from flask import Flask, jsonify, send_from_directory, request, render_template_string
+from flask import Flask, Response, send_from_directory, request
+from flask.json.provider import JSONProvider
+from werkzeug.routing import BaseConverter
 from flask_cors import CORS
+from flask_compress import Compress
+from asgiref.wsgi import WsgiToAsgi
 import os
+import hashlib
+import sqlite3
+import functools
+import threading
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from skyfield.api import EarthSatellite, load, Topos
+from skyfield.api import EarthSatellite, load, Topos, iers2010
+from skyfield.sgp4lib import TEME, theta_GMST1982
+from sgp4.api import SatrecArray, jday
 import numpy as np
-import plotly
 import plotly.graph_objects as go
-import json
+import orjson
+from build_frontend import DIST_DIR, build_index
+
+# Shared orjson options; numpy support lets handlers return numpy scalars and arrays as-is
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster request parsing and response encoding"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class FastIntConverter(BaseConverter):
+    """Route converter for non-negative integer IDs without IntegerConverter's min/max checks"""
+    regex = r'\d+'
+
+    def to_python(self, value):
+        return int(value)
+
+    def to_url(self, value):
+        return str(value)
+
+# Skyfield time scale shared by every request; the builtin leap-second and
+# Delta T tables avoid re-reading (or downloading) data files per call
+TS = load.timescale(builtin=True)
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+app.json = OrjsonProvider(app)  # Used by request.json
+app.url_map.converters['fint'] = FastIntConverter
+
+def json_response(obj, status=200):
+    """Encode obj with orjson straight into a JSON Response, bypassing jsonify"""
+    return Response(orjson.dumps(obj, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
+def encode_json_object(obj, raw_members=None):
+    """Encode dict obj with orjson, plus raw_members whose values are already-encoded JSON bytes"""
+    body = orjson.dumps(obj, option=ORJSON_OPTIONS)
+    if not raw_members:
+        return body
+    # Splice the members in before the closing brace instead of embedding them as strings
+    members = b','.join(orjson.dumps(key) + b':' + raw for key, raw in raw_members.items())
+    return body[:-1] + (b',' if obj else b'') + members + b'}'
+
+def etag_json_response(obj, raw_members=None):
+    """Encode obj like json_response, tagged with a content hash; 304 if the client already holds it"""
+    body = encode_json_object(obj, raw_members)
+    # Weak, so the tag survives flask-compress re-encoding the body
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def binary_response(head, columns, status=200):
+    """Encode named columns of head['count'] values as little-endian float32 after a JSON header
+
+    Layout: uint32 header length, JSON header (space-padded to 4 bytes so the data is
+    Float32Array-aligned), then one row of float32 values per column in header['columns'] order.
+    """
+    header = orjson.dumps({**head, 'columns': list(columns)}, option=ORJSON_OPTIONS)
+    header += b' ' * (-len(header) % 4)
+    data = np.array(list(columns.values()), dtype='<f4').tobytes() if columns else b''
+    body = np.uint32(len(header)).astype('<u4').tobytes() + header + data
+    return Response(body, status=status, mimetype='application/octet-stream')
+
+def ndjson_stream_response(head, chunks):
+    """Stream head then each dict produced by chunks as one JSON line, as soon as it is ready"""
+    def generate():
+        yield orjson.dumps(head, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        try:
+            for chunk in chunks:
+                yield orjson.dumps(chunk, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except Exception as e:
+            # The 200 status is already sent, so report failures in-band
+            yield orjson.dumps({'error': f"Propagation failed: {str(e)}"}, option=orjson.OPT_APPEND_NEWLINE)
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+def json_stream_response(head, key, items, status=200, raw_members=None):
+    """Stream a JSON object made of head's (and raw_members') members plus a `key` list, one list item per chunk"""
+    def generate():
+        yield encode_json_object(head, raw_members)[:-1] + b',"' + key.encode() + b'":['
+        # Pop from the end of a reversed list so each item can be freed once it is sent
+        items.reverse()
+        separator = b''
+        while items:
+            yield separator + orjson.dumps(items.pop(), option=ORJSON_OPTIONS)
+            separator = b','
+        yield b']}'
+    return Response(generate(), status=status, mimetype='application/json')
+
+# Static CORS policy for the API; max_age lets browsers cache preflight results for a day
+ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '*').split(',')
+CORS(
+    app,
+    resources={r"/api/*": {"origins": ALLOWED_ORIGINS}},
+    methods=['GET', 'POST', 'DELETE'],
+    allow_headers=['Content-Type'],
+    max_age=86400
+)
+
+# Compress JSON and NDJSON API responses; the index page is served precompressed from disk
+# instead, and float32 binary payloads barely compress. Small bodies are not worth the CPU.
+# Streamed responses (NDJSON, propagate-all) have their own algorithm list, which otherwise
+# defaults to zstd/br/deflate; use the same brotli-then-gzip preference for both.
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'application/x-ndjson']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 2048
+Compress(app)
+
+# ASGI entry point for uvicorn (e.g. `uvicorn app:asgi_app`)
+asgi_app = WsgiToAsgi(app)
+
+@dataclass(slots=True)
+class Satellite:
+    """A stored satellite; slotted to keep per-instance memory low, and serialized natively by orjson"""
+    id: int
+    name: str
+    tle: str
+    created_at: str
+
+# Default SQLite file holding the satellites, shared by every worker process
+DEFAULT_SATELLITES_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'satellites.db')
+
+# AUTOINCREMENT keeps IDs from ever being reused; the revision counts committed
+# mutations so each worker can tell when its in-process copy is stale, and the
+# random ETag prefix keeps ETags from one database from matching another's
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS satellites (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    tle TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('revision', 0);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('etag_prefix', lower(hex(randomblob(4))));
+"""
+_REVISION_QUERY = "SELECT value FROM store_meta WHERE key = 'revision'"
+
+# This process's connection; reopened after a fork because SQLite connections
+# must not cross processes (e.g. when gunicorn preloads the app)
+_db_connection = None
+_db_pid = None
+_ETAG_PREFIX = None
+
+def _db_path():
+    """Return the SQLite database to open, resolved when the first connection is made"""
+    # Tests get a private in-memory store rather than a file in the source tree
+    if app.testing:
+        return ':memory:'
+    return os.environ.get('SATELLITES_DB', DEFAULT_SATELLITES_DB)
+
+def _db():
+    """Return this process's SQLite connection, creating the schema on first use (call with the lock held)"""
+    global _db_connection, _db_pid, _ETAG_PREFIX
+    if _db_pid != os.getpid():
+        _db_connection = sqlite3.connect(_db_path(), timeout=10, check_same_thread=False, isolation_level=None)
+        _db_connection.execute('PRAGMA journal_mode=WAL')
+        _db_connection.executescript(_SCHEMA)
+        _ETAG_PREFIX = _db_connection.execute("SELECT value FROM store_meta WHERE key = 'etag_prefix'").fetchone()[0]
+        _db_pid = os.getpid()
+    return _db_connection
+
+def _write(sql, params):
+    """Run one INSERT/DELETE ... RETURNING and bump the revision in one transaction; return (rows, revision)"""
+    db = _db()
+    db.execute('BEGIN IMMEDIATE')
+    try:
+        rows = db.execute(sql, params).fetchall()
+        if rows:
+            db.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'revision'")
+        revision = db.execute(_REVISION_QUERY).fetchone()[0]
+        db.execute('COMMIT')
+    except BaseException:
+        db.execute('ROLLBACK')
+        raise
+    return rows, revision
+
+# In-process copy of the satellites table, keyed by ID (dicts preserve insertion order)
+satellites_by_id = {}
+
+# Parsed EarthSatellite (with its SGP4 Satrec) per satellite ID, built once per
+# process; None when the stored TLE is malformed
+_satellite_models = {}
+
+# Guards satellites_by_id, _satellite_models, the connection and the list cache below
+_satellites_lock = threading.Lock()
 
-# In-memory storage for satellites
-satellites = []
+# Serialized GET /api/satellites body, rebuilt lazily after each mutation
+_list_cache = None
+
+# Store revision the in-process copy reflects, exposed in the list's ETag
+_list_version = None
+
+def _sync_satellites():
+    """Reload the in-process copy if any worker changed the store since (call with the lock held)"""
+    global _list_cache, _list_version
+    revision = _db().execute(_REVISION_QUERY).fetchone()[0]
+    if revision == _list_version:
+        return
+    
+    satellites_by_id.clear()
+    models = {}
+    for row in _db().execute('SELECT id, name, tle, created_at FROM satellites ORDER BY id'):
+        satellite = Satellite(*row)
+        satellites_by_id[satellite.id] = satellite
+        # IDs are never reused and TLEs never change, so already-parsed models stay valid
+        model = _satellite_models.get(satellite.id)
+        models[satellite.id] = model if model is not None else _parse_tle(satellite.name, satellite.tle)
+    _satellite_models.clear()
+    _satellite_models.update(models)
+    _list_cache = None
+    _list_version = revision
+
+def _satellites_changed(revision):
+    """Invalidate the cached satellite list after this process's own create or delete (call with the lock held)"""
+    global _list_cache, _list_version
+    _list_cache = None
+    _list_version = revision
+
+def _lookup_satellite(satellite_id):
+    """Return the (Satellite, EarthSatellite) pair for an ID under the store lock"""
+    with _satellites_lock:
+        _sync_satellites()
+        satellite_data = satellites_by_id.get(satellite_id)
+        return satellite_data, _satellite_models.get(satellite_id)
+
+def _parse_tle(name, tle):
+    """Build an EarthSatellite from a stored two-line TLE, or return None if it is malformed"""
+    tle_lines = tle.strip().split('\n')
+    if len(tle_lines) != 2:
+        return None
+    try:
+        return EarthSatellite(tle_lines[0], tle_lines[1], name, TS)
+    except ValueError:
+        return None
+
+# Static part of the health check body; only the timestamp changes per request
+_HEALTH_PREFIX = b'{"status":"healthy","message":"Backend server is running correctly","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'message': 'Backend server is running correctly',
-        'timestamp': datetime.now().isoformat()
-    })
+    timestamp = datetime.now().isoformat().encode('ascii')
+    return Response(_HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX, mimetype='application/json')
+
+# Fields that can be requested through GET /api/satellites?fields=...
+SATELLITE_FIELDS = ('id', 'name', 'tle', 'created_at')
 
 @app.route('/api/satellites', methods=['GET'])
 def get_satellites():
-    """Get all satellites"""
-    return jsonify(satellites)
+    """Get all satellites, optionally filtered by ?ids=1,2,3 and projected with ?fields=id,name"""
+    global _list_cache
+    
+    ids_param = request.args.get('ids')
+    fields_param = request.args.get('fields')
+    try:
+        ids = [int(i) for i in ids_param.split(',')] if ids_param else None
+    except ValueError:
+        return json_response({'error': 'ids must be a comma-separated list of integers'}, 400)
+    fields = tuple(fields_param.split(',')) if fields_param else SATELLITE_FIELDS
+    if not set(fields) <= set(SATELLITE_FIELDS):
+        return json_response({'error': f"fields must be a subset of {', '.join(SATELLITE_FIELDS)}"}, 400)
+    
+    with _satellites_lock:
+        _sync_satellites()
+        etag = f'{_ETAG_PREFIX}-{_list_version}'
+        body = None
+        # Short-circuit clients that already hold the current list
+        if not request.if_none_match.contains_weak(etag):
+            if ids is None and fields == SATELLITE_FIELDS:
+                if _list_cache is None:
+                    _list_cache = orjson.dumps(list(satellites_by_id.values()))
+                body = _list_cache
+            else:
+                if ids is None:
+                    selected = satellites_by_id.values()
+                else:
+                    selected = [satellites_by_id[i] for i in dict.fromkeys(ids) if i in satellites_by_id]
+                body = orjson.dumps([{field: getattr(sat, field) for field in fields} for sat in selected])
+    
+    if body is None:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/api/satellites', methods=['POST'])
 def create_satellite():
     """Create a new satellite"""
-    data = request.json
+    # Parse the raw body with orjson, skipping Flask's request.json machinery
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return json_response({'error': 'Request body must be valid JSON'}, 400)
     
     # Validate required fields
-    if not data or 'name' not in data or 'tle' not in data:
-        return jsonify({'error': 'Name and TLE data are required'}), 400
+    if not isinstance(data, dict):
+        return json_response({'error': 'Name and TLE data are required'}, 400)
+    name = data.get('name')
+    tle = data.get('tle')
+    if not isinstance(name, str) or not isinstance(tle, str):
+        return json_response({'error': 'Name and TLE data are required'}, 400)
     
-    # Create satellite object
-    satellite = {
-        'id': len(satellites) + 1,
-        'name': data['name'],
-        'tle': data['tle'],
-        'created_at': datetime.now().isoformat()
-    }
+    # Parse the TLE once here so propagation requests can reuse the SGP4 model
+    model = _parse_tle(name, tle)
     
-    # Add to satellites list
-    satellites.append(satellite)
+    # Store the satellite, then add it to this process's copy of the index
+    with _satellites_lock:
+        _sync_satellites()
+        rows, revision = _write(
+            'INSERT INTO satellites (name, tle, created_at) VALUES (?, ?, ?) RETURNING id, name, tle, created_at',
+            (name, tle, datetime.now().isoformat())
+        )
+        satellite = Satellite(*rows[0])
+        _satellite_models[satellite.id] = model
+        if revision == _list_version + 1:
+            satellites_by_id[satellite.id] = satellite
+            _satellites_changed(revision)
+        else:
+            # Another worker wrote in between; reload (our model is reused)
+            _sync_satellites()
     
-    return jsonify(satellite), 201
+    return json_response(satellite, 201)
 
-@app.route('/api/satellites/<int:satellite_id>', methods=['DELETE'])
+@app.route('/api/satellites/<fint:satellite_id>', methods=['DELETE'])
 def delete_satellite(satellite_id):
     """Delete a satellite by ID"""
-    global satellites
-    
-    # Find the satellite by ID
-    satellite_index = None
-    for index, satellite in enumerate(satellites):
-        if satellite['id'] == satellite_id:
-            satellite_index = index
-            break
+    with _satellites_lock:
+        _sync_satellites()
+        rows, revision = _write(
+            'DELETE FROM satellites WHERE id = ? RETURNING id, name, tle, created_at', (satellite_id,)
+        )
+        removed_satellite = Satellite(*rows[0]) if rows else None
+        if removed_satellite is not None:
+            if revision == _list_version + 1:
+                satellites_by_id.pop(satellite_id, None)
+                _satellite_models.pop(satellite_id, None)
+                _satellites_changed(revision)
+            else:
+                _sync_satellites()
     
-    # If satellite found, remove it
-    if satellite_index is not None:
-        removed_satellite = satellites.pop(satellite_index)
-        return jsonify({
-            'message': f"Satellite '{removed_satellite['name']}' deleted successfully",
+    # If satellite found, report what was removed
+    if removed_satellite is not None:
+        return json_response({
+            'message': f"Satellite '{removed_satellite.name}' deleted successfully",
             'deleted': removed_satellite
         })
     else:
-        return jsonify({'error': f"Satellite with ID {satellite_id} not found"}), 404
+        return json_response({'error': f"Satellite with ID {satellite_id} not found"}, 404)
+
+def _xyz_columns(vectors):
+    """Split a (3, N) vector array into {'x', 'y', 'z'} arrays for the JSON response"""
+    x, y, z = vectors
+    return {'x': x, 'y': y, 'z': z}
+
+# Bounds on a propagation window, so one request can't tie up a worker indefinitely
+MIN_STEP_SIZE = 0.05  # In minutes
+MAX_GRID_POINTS = 200_000
+
+def _grid_error(start_time, end_time, step_size):
+    """Return why a propagation window is not acceptable, or None if it is"""
+    if (start_time.tzinfo is None) != (end_time.tzinfo is None):
+        return 'start_time and end_time must both have a UTC offset or both omit it'
+    if end_time < start_time:
+        return 'end_time must not be before start_time'
+    if not (np.isfinite(step_size) and step_size >= MIN_STEP_SIZE):
+        return f"step_size must be at least {MIN_STEP_SIZE} minutes"
+    if (end_time - start_time).total_seconds() / 60 / step_size + 1 > MAX_GRID_POINTS:
+        return f"The time range spans more than {MAX_GRID_POINTS} steps; use a larger step_size or a shorter range"
+    return None
+
+# A propagation time grid: Skyfield Time array, the same instants as SGP4 (jd, fr)
+# UTC Julian date pairs, and their timestamps for the response
+TimeGrid = namedtuple('TimeGrid', ['t', 'jd', 'fr', 'times'])
+
+def _time_grid(start_time, end_time, step_size):
+    """Build the whole propagation time grid in one go, shared by every satellite propagated over it"""
+    # Keyed on ISO strings: aware datetimes compare equal across UTC offsets, but the
+    # grid is built from the wall-clock fields and its times carry the offset
+    return _cached_time_grid(start_time.isoformat(), end_time.isoformat(), step_size)
+
+@functools.lru_cache(maxsize=32)
+def _cached_time_grid(start_iso, end_iso, step_size):
+    """Build the time grid between two ISO timestamps"""
+    start_time = datetime.fromisoformat(start_iso)
+    end_time = datetime.fromisoformat(end_iso)
+    
+    # Skyfield memoizes nutation/precession (t.M, t.gast) on the Time object, so reusing the
+    # grid computes them once per (start, end, step) rather than once per satellite
+    # Same points the old `while current_time <= end_time` loop visited
+    total_minutes = (end_time - start_time).total_seconds() / 60
+    n_steps = max(int(np.floor(total_minutes / step_size + 1e-9)) + 1, 0)
+    minutes = np.arange(n_steps) * step_size
+    
+    # Skyfield normalizes minute values past 59, so one call covers every step
+    t = TS.utc(
+        start_time.year,
+        start_time.month,
+        start_time.day,
+        start_time.hour,
+        start_time.minute + minutes,
+        start_time.second + start_time.microsecond / 1e6
+    )
+    jd, fr = jday(
+        start_time.year,
+        start_time.month,
+        start_time.day,
+        start_time.hour,
+        start_time.minute,
+        start_time.second + start_time.microsecond / 1e6
+    )
+    
+    # datetime64 grid in one vectorized step; orjson formats it exactly like isoformat()
+    # while encoding. Offset-aware inputs keep their UTC offset via per-step strings.
+    if start_time.tzinfo is None:
+        times = np.datetime64(start_time, 'us') + np.round(minutes * 60e6).astype('timedelta64[us]')
+    else:
+        times = tuple((start_time + timedelta(minutes=m)).isoformat() for m in minutes.tolist())
+    
+    # The grid is shared between requests, so it must not be modified
+    grid = TimeGrid(t, np.full(n_steps, jd), fr + minutes / 1440.0, times)
+    for array in grid[1:]:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+    return grid
+
+# Optional per-step arrays a propagation response can carry alongside `times`
+PROPAGATION_FIELDS = ('latitudes', 'longitudes', 'elevations', 'positions', 'velocities')
+
+def _requested_fields(data):
+    """Return the propagation fields named by the body's optional `fields` list, or None if invalid"""
+    fields = data.get('fields')
+    if fields is None:
+        return PROPAGATION_FIELDS
+    if not isinstance(fields, list) or not all(field in PROPAGATION_FIELDS for field in fields):
+        return None
+    return tuple(field for field in PROPAGATION_FIELDS if field in fields)
+
+def _requested_paging(data):
+    """Return the body's optional (max_points, offset, limit) paging fields, or None if invalid"""
+    max_points = data.get('max_points')
+    offset = data.get('offset', 0)
+    limit = data.get('limit')
+    
+    def valid(value, minimum):
+        return value is None or (isinstance(value, int) and not isinstance(value, bool) and value >= minimum)
+    
+    if offset is None or not (valid(max_points, 1) and valid(offset, 0) and valid(limit, 0)):
+        return None
+    return max_points, offset, limit
 
-@app.route('/api/satellites/<int:satellite_id>/propagate', methods=['POST'])
+def _page_slice(n_points, max_points, offset, limit):
+    """Return a slice over the time grid for the paging fields, and the number of points at that sampling"""
+    # Sample every `stride`-th step so at most max_points remain, then page through those
+    stride = max(-(-n_points // max_points), 1) if max_points else 1
+    start = offset * stride
+    stop = None if limit is None else (offset + limit) * stride
+    return slice(start, stop, stride), len(range(0, n_points, stride))
+
+def _take(values, selection):
+    """Apply a time-grid slice to a response array, list or {'x', 'y', 'z'} dict, keeping arrays C-contiguous for orjson"""
+    if isinstance(values, dict):
+        return {axis: _take(column, selection) for axis, column in values.items()}
+    if isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values[selection])
+    return values[selection]
+
+def _wire(values):
+    """Convert a response float array, or {'x', 'y', 'z'} dict of them, to float32 for the wire"""
+    # ~7 significant digits: under a meter in position or elevation, ~1e-5 deg in lat/lon,
+    # and orjson writes float32 with about half the characters of float64
+    if isinstance(values, dict):
+        return {axis: _wire(column) for axis, column in values.items()}
+    return values.astype(np.float32)
+
+@app.route('/api/satellites/<fint:satellite_id>/propagate', methods=['POST'])
 def propagate_satellite(satellite_id):
     """Propagate satellite orbit using Skyfield"""
     # Get propagation parameters from request
     data = request.json
     
     if not data or 'start_time' not in data or 'end_time' not in data or 'step_size' not in data:
-        return jsonify({'error': 'Start time, end time, and step size are required'}), 400
+        return json_response({'error': 'Start time, end time, and step size are required'}, 400)
+    
+    # Optional subset of the per-step arrays to return (default: all of them)
+    fields = _requested_fields(data)
+    if fields is None:
+        return json_response({'error': f"fields must be a list drawn from {', '.join(PROPAGATION_FIELDS)}"}, 400)
     
-    # Find the satellite by ID
-    satellite_data = None
-    for sat in satellites:
-        if sat['id'] == satellite_id:
-            satellite_data = sat
-            break
+    # Optional downsampling (max_points) and paging (offset, limit) of the per-step arrays
+    paging = _requested_paging(data)
+    if paging is None:
+        return json_response({'error': 'max_points, offset and limit must be non-negative integers (max_points at least 1)'}, 400)
+    
+    # Find the satellite and its parsed model by ID
+    satellite_data, satellite = _lookup_satellite(satellite_id)
     
     if not satellite_data:
-        return jsonify({'error': f"Satellite with ID {satellite_id} not found"}), 404
+        return json_response({'error': f"Satellite with ID {satellite_id} not found"}, 404)
     
     try:
         # Parse start and end times
@@ -97,84 +541,236 @@ def propagate_satellite(satellite_id):
         end_time = datetime.fromisoformat(data['end_time'])
         step_size = float(data['step_size'])  # In minutes
         
-        # Load Skyfield time scale
-        ts = load.timescale()
-        
-        # Parse TLE data
-        tle_lines = satellite_data['tle'].strip().split('\n')
-        if len(tle_lines) != 2:
-            return jsonify({'error': 'Invalid TLE data format'}), 400
-        
-        # Create Skyfield satellite object
-        satellite = EarthSatellite(tle_lines[0], tle_lines[1], satellite_data['name'], ts)
-        
-        # Initialize lists for results
-        latitudes = []
-        longitudes = []
-        elevations = []
-        positions = []
-        velocities = []
-        times = []
-        
-        # Propagate orbit
-        current_time = start_time
-        while current_time <= end_time:
-            # Convert current time to Skyfield time
-            t = ts.utc(
-                current_time.year,
-                current_time.month,
-                current_time.day,
-                current_time.hour,
-                current_time.minute,
-                current_time.second
-            )
-            
-            # Get satellite position and velocity
-            geocentric = satellite.at(t)
-            subpoint = geocentric.subpoint()
-            
-            # Store results
-            latitudes.append(subpoint.latitude.degrees)
-            longitudes.append(subpoint.longitude.degrees)
-            elevations.append(subpoint.elevation.m)
-            
-            # Get position (x, y, z) in kilometers
-            position = geocentric.position.km
-            positions.append({
-                'x': float(position[0]),
-                'y': float(position[1]),
-                'z': float(position[2])
-            })
-            
-            # Get velocity in km/s
-            velocity = geocentric.velocity.km_per_s
-            velocities.append({
-                'x': float(velocity[0]),
-                'y': float(velocity[1]),
-                'z': float(velocity[2])
-            })
-            
-            times.append(current_time.isoformat())
-            
-            # Increment time by step size
-            current_time += timedelta(minutes=step_size)
-        
-        # Return propagation results
-        return jsonify({
+        # Reject windows that can't be computed or would pin a worker
+        grid_error = _grid_error(start_time, end_time, step_size)
+        if grid_error:
+            return json_response({'error': grid_error}, 400)
+        
+        # Reuse the Skyfield satellite object parsed when the satellite was created
+        if satellite is None:
+            return json_response({'error': 'Invalid TLE data format'}, 400)
+        
+        # ?format=ndjson: propagate chunk by chunk and send each one as soon as it is ready
+        if request.args.get('format') == 'ndjson':
+            grid = _time_grid(start_time, end_time, step_size)
+            selection, total_points = _page_slice(len(grid.jd), *paging)
+            return ndjson_stream_response({
+                'satellite_id': satellite_id,
+                'satellite_name': satellite_data.name,
+                'total_points': total_points
+            }, _propagation_chunks(satellite, TimeGrid(*(_take(column, selection) for column in grid)), fields))
+        
+        # Propagate orbit over the whole time grid in one call (or reuse a cached track)
+        track = _propagate_track(satellite, start_time, end_time, step_size)
+        
+        # Return the requested propagation results; position (x, y, z) in kilometers and velocity in km/s
+        values = {
+            'latitudes': track.latitudes,
+            'longitudes': track.longitudes,
+            'elevations': track.elevations
+        }
+        if 'positions' in fields or 'velocities' in fields:
+            positions, velocities = _track_state_vectors(satellite, start_time, end_time, step_size)
+            values['positions'] = _xyz_columns(positions)
+            values['velocities'] = _xyz_columns(velocities)
+        selection, total_points = _page_slice(len(track.latitudes), *paging)
+        propagation_data = {'times': _take(track.grid.times, selection)}
+        propagation_data.update((field, _wire(_take(values[field], selection))) for field in fields)
+        
+        # ?format=bin: float32 columns instead of JSON numbers; times follow from start_time and time_step
+        if request.args.get('format') == 'bin':
+            times = propagation_data.pop('times')
+            columns = {}
+            for field, value in propagation_data.items():
+                if isinstance(value, dict):
+                    columns.update((f"{field}.{axis}", column) for axis, column in value.items())
+                else:
+                    columns[field] = value
+            return binary_response({
+                'satellite_id': satellite_id,
+                'satellite_name': satellite_data.name,
+                'total_points': total_points,
+                'count': len(times),
+                'start_time': times[0] if len(times) else None,
+                'time_step': step_size * 60 * selection.step  # In seconds
+            }, columns)
+        
+        return etag_json_response({
             'satellite_id': satellite_id,
-            'satellite_name': satellite_data['name'],
-            'propagation_data': {
-                'times': times,
-                'latitudes': latitudes,
-                'longitudes': longitudes,
-                'elevations': elevations,
-                'positions': positions,
-                'velocities': velocities
-            }
+            'satellite_name': satellite_data.name,
+            'total_points': total_points,
+            'propagation_data': propagation_data
         })
     
     except Exception as e:
-        return jsonify({'error': f"Propagation failed: {str(e)}"}), 500
+        return json_response({'error': f"Propagation failed: {str(e)}"}, 500)
+
+def _propagate_teme(models, grid):
+    """Propagate Satrec models over a time grid in one SatrecArray call; return TEME (r, v) of shape (S, N, 3)"""
+    _, r_teme, v_teme = SatrecArray(models).sgp4(grid.jd, grid.fr)
+    return r_teme, v_teme
+
+def _teme_subpoints(r_teme, grid):
+    """Return geodetic latitude (deg), longitude (deg) and elevation (m) arrays of shape (S, N) for TEME positions"""
+    # TEME -> Earth-fixed is a rotation about z by Greenwich mean sidereal time, computed
+    # once for the shared grid. With no polar motion loaded this is exactly what Skyfield's
+    # TEME -> GCRS -> ITRS path reduces to, minus the precession-nutation matrices that cancel
+    theta, _ = theta_GMST1982(grid.t.whole, grid.t.ut1_fraction)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    x = r_teme[..., 0]
+    y = r_teme[..., 1]
+    z = r_teme[..., 2]
+    x_ecef = cos_theta * x + sin_theta * y
+    y_ecef = cos_theta * y - sin_theta * x
+    
+    # Geodetic latitude on the IERS 2010 ellipsoid, iterated the same way as Skyfield's Geoid
+    a = iers2010.radius.km
+    flattening = 1.0 / iers2010.inverse_flattening
+    e2 = flattening * (2.0 - flattening)
+    R = np.hypot(x_ecef, y_ecef)
+    lat = np.arctan2(z, R)
+    for _ in range(3):
+        sin_lat = np.sin(lat)
+        aC = a / np.sqrt(1.0 - e2 * sin_lat * sin_lat)
+        hyp = z + aC * e2 * sin_lat
+        lat = np.arctan2(hyp, R)
+    lon = (np.arctan2(y_ecef, x_ecef) - np.pi) % (2.0 * np.pi) - np.pi
+    elevation_m = (np.sqrt(hyp * hyp + R * R) - aC) * 1000.0
+    return np.degrees(lat), np.degrees(lon), elevation_m
+
+def _teme_to_gcrs(r_teme, v_teme, grid):
+    """Rotate TEME (r, v) of shape (S, N, 3) into GCRS position (km) and velocity (km/s) of shape (S, 3, N)"""
+    # Only needed for positions and velocities: the rotation pulls in Skyfield's full
+    # precession-nutation model, which dominates the cost of a fresh time grid
+    R = TEME.rotation_at(grid.t)
+    return np.einsum('jin,snj->sin', R, r_teme), np.einsum('jin,snj->sin', R, v_teme)
+
+# One satellite propagated over a time grid: the grid, subpoint arrays, and the
+# (1, N, 3) TEME state vectors for deriving GCRS positions and velocities on demand
+Track = namedtuple('Track', ['grid', 'latitudes', 'longitudes', 'elevations', 'r_teme', 'v_teme'])
+
+# Time steps per line of a ?format=ndjson propagation stream
+STREAM_CHUNK_POINTS = 500
+
+def _propagation_chunks(satellite, grid, fields):
+    """Yield propagation_data dicts for consecutive STREAM_CHUNK_POINTS-step slices of the grid"""
+    for start in range(0, len(grid.jd), STREAM_CHUNK_POINTS):
+        chunk = TimeGrid(*(column[start:start + STREAM_CHUNK_POINTS] for column in grid))
+        r_teme, v_teme = _propagate_teme([satellite.model], chunk)
+        latitudes, longitudes, elevations = _teme_subpoints(r_teme, chunk)
+        values = {'latitudes': latitudes[0], 'longitudes': longitudes[0], 'elevations': elevations[0]}
+        if 'positions' in fields or 'velocities' in fields:
+            positions, velocities = _teme_to_gcrs(r_teme, v_teme, chunk)
+            values['positions'] = _xyz_columns(positions[0])
+            values['velocities'] = _xyz_columns(velocities[0])
+        
+        propagation_data = {'times': chunk.times}
+        propagation_data.update((field, _wire(values[field])) for field in fields)
+        yield propagation_data
+
+def _propagate_track(satellite, start_time, end_time, step_size):
+    """Propagate one satellite over the grid, memoized so repeated requests skip SGP4"""
+    # Keyed on ISO strings: aware datetimes compare equal across UTC offsets, but the
+    # track is computed from the wall-clock fields and labelled with the offset
+    return _cached_track(satellite, start_time.isoformat(), end_time.isoformat(), step_size)
+
+@functools.lru_cache(maxsize=128)
+def _cached_track(satellite, start_iso, end_iso, step_size):
+    """Propagate one satellite over the grid between two ISO timestamps"""
+    # Keyed on the EarthSatellite object itself: IDs are never reused and a satellite's
+    # TLE never changes, so a deleted or re-created satellite can only miss
+    grid = _time_grid(datetime.fromisoformat(start_iso), datetime.fromisoformat(end_iso), step_size)
+    r_teme, v_teme = _propagate_teme([satellite.model], grid)
+    latitudes, longitudes, elevations = _teme_subpoints(r_teme, grid)
+    track = Track(grid, latitudes[0], longitudes[0], elevations[0], r_teme, v_teme)
+    
+    # The arrays are shared between every request that hits this entry
+    for array in track[1:]:
+        array.setflags(write=False)
+    return track
+
+def _track_state_vectors(satellite, start_time, end_time, step_size):
+    """Return a cached track's (3, N) GCRS position (km) and velocity (km/s), computed only when requested"""
+    return _cached_state_vectors(satellite, start_time.isoformat(), end_time.isoformat(), step_size)
+
+@functools.lru_cache(maxsize=32)
+def _cached_state_vectors(satellite, start_iso, end_iso, step_size):
+    """Convert the cached track between two ISO timestamps to GCRS state vectors"""
+    track = _cached_track(satellite, start_iso, end_iso, step_size)
+    positions, velocities = _teme_to_gcrs(track.r_teme, track.v_teme, track.grid)
+    positions.setflags(write=False)
+    velocities.setflags(write=False)
+    return positions[0], velocities[0]
+
+# Map layout shared by every ground track figure; handlers only add center and zoom
+_BASE_MAPBOX_LAYOUT = dict(
+    style="white-bg",
+    layers=[
+        {
+            "below": "traces",
+            "sourcetype": "raster",
+            "sourceattribution": "United States Geological Survey",
+            "source": [
+                "https://basemap.nationalmap.gov/arcgis/rest/services/USGSImageryOnly/MapServer/tile/{z}/{y}/{x}"
+            ]
+        }
+    ],
+    bearing=0,
+)
+_MAP_FIGURE_LAYOUT = dict(
+    width=800,
+    height=700,
+    margin=dict(l=0, r=0, t=0, b=0),
+)
+_COMBINED_LEGEND = dict(
+    yanchor="top",
+    y=0.99,
+    xanchor="left",
+    x=0.01,
+    bgcolor="rgba(0,0,0,0.5)"
+)
+
+# Plotly's default template, serialized once; pio.to_json would re-encode it into every figure
+_MAP_TEMPLATE_JSON = orjson.dumps(go.Figure().layout.template.to_plotly_json())
+
+def _map_figure_json(traces, **layout):
+    """Encode plain trace dicts and a layout as Plotly figure JSON, skipping graph object validation"""
+    return (
+        b'{"data":' + orjson.dumps(traces, option=ORJSON_OPTIONS)
+        + b',"layout":{"template":' + _MAP_TEMPLATE_JSON + b',' + orjson.dumps(layout)[1:] + b'}'
+    )
+
+def _map_trace(latitudes, longitudes, color, **attributes):
+    """Build a Scattermapbox trace dict for one ground track, broken at date line crossings"""
+    track_lat, track_lon = _break_at_dateline(latitudes, longitudes)
+    return dict(
+        type="scattermapbox",
+        mode="markers+lines",
+        lon=track_lon,
+        lat=track_lat,
+        marker=dict(size=5, color=color),
+        line=dict(width=2, color=color),
+        **attributes
+    )
+
+# Single-satellite ground track maps are downsampled to at most this many points;
+# more would not be visible at world zoom but would still be serialized and drawn
+MAP_MAX_POINTS = 2000
+
+# Color palette for satellites in the combined ground track
+TRACK_COLORS = (
+    '#1f77b4',  # blue
+    '#ff7f0e',  # orange
+    '#2ca02c',  # green
+    '#d62728',  # red
+    '#9467bd',  # purple
+    '#8c564b',  # brown
+    '#e377c2',  # pink
+    '#7f7f7f',  # gray
+    '#bcbd22',  # olive
+    '#17becf'   # teal
+)
 
 @app.route('/api/satellites/propagate-all', methods=['POST'])
 def propagate_all_satellites():
@@ -183,11 +779,21 @@ def propagate_all_satellites():
     data = request.json
     
     if not data or 'start_time' not in data or 'end_time' not in data or 'step_size' not in data:
-        return jsonify({'error': 'Start time, end time, and step size are required'}), 400
+        return json_response({'error': 'Start time, end time, and step size are required'}, 400)
+    
+    # Optional subset of the per-step arrays to return (default: all of them)
+    fields = _requested_fields(data)
+    if fields is None:
+        return json_response({'error': f"fields must be a list drawn from {', '.join(PROPAGATION_FIELDS)}"}, 400)
+    
+    # Snapshot the satellites and their parsed models
+    with _satellites_lock:
+        _sync_satellites()
+        snapshot = [(satellite_data, _satellite_models.get(satellite_data.id)) for satellite_data in satellites_by_id.values()]
     
     # Check if we have satellites
-    if not satellites:
-        return jsonify({'error': 'No satellites available to propagate'}), 404
+    if not snapshot:
+        return json_response({'error': 'No satellites available to propagate'}, 404)
     
     try:
         # Parse start and end times
@@ -195,325 +801,135 @@ def propagate_all_satellites():
         end_time = datetime.fromisoformat(data['end_time'])
         step_size = float(data['step_size'])  # In minutes
         
-        # Load Skyfield time scale
-        ts = load.timescale()
-        
-        # Combined results
+        # Reject windows that can't be computed or would pin a worker
+        grid_error = _grid_error(start_time, end_time, step_size)
+        if grid_error:
+            return json_response({'error': grid_error}, 400)
+        
+        # Every satellite shares the same time grid
+        grid = _time_grid(start_time, end_time, step_size)
+        
+        # Collect the parsed SGP4 models, skipping satellites whose TLE is invalid
+        models = []
+        propagated_satellites = []
+        for satellite_data, satellite in snapshot:
+            if satellite is not None:
+                models.append(satellite.model)
+                propagated_satellites.append(satellite_data)
+        
+        if not models:
+            return json_response({'error': 'Failed to propagate any satellites'}, 500)
+        
+        # One batched SGP4 call for every (satellite, time) pair, then subpoints for all
+        # satellites at once; GCRS vectors only if positions or velocities were requested
+        r_teme, v_teme = _propagate_teme(models, grid)
+        latitudes, longitudes, elevations = _teme_subpoints(r_teme, grid)
+        if 'positions' in fields or 'velocities' in fields:
+            positions, velocities = _teme_to_gcrs(r_teme, v_teme, grid)
+        
+        # Combined results, one per satellite; position (x, y, z) in kilometers and velocity in km/s
         combined_results = []
+        for idx, satellite_data in enumerate(propagated_satellites):
+            values = {
+                'latitudes': latitudes[idx],
+                'longitudes': longitudes[idx],
+                'elevations': elevations[idx]
+            }
+            if 'positions' in fields or 'velocities' in fields:
+                values['positions'] = _xyz_columns(positions[idx])
+                values['velocities'] = _xyz_columns(velocities[idx])
+            propagation_data = {'times': grid.times}
+            propagation_data.update((field, _wire(values[field])) for field in fields)
+            combined_results.append({
+                'satellite_id': satellite_data.id,
+                'satellite_name': satellite_data.name,
+                'propagation_data': propagation_data
+            })
         
-        # Propagate orbit for each satellite
-        for satellite_data in satellites:
-            try:
-                # Parse TLE data
-                tle_lines = satellite_data['tle'].strip().split('\n')
-                if len(tle_lines) != 2:
-                    continue  # Skip this satellite if TLE format is invalid
-                
-                # Create Skyfield satellite object
-                satellite = EarthSatellite(tle_lines[0], tle_lines[1], satellite_data['name'], ts)
-                
-                # Initialize lists for results
-                latitudes = []
-                longitudes = []
-                elevations = []
-                positions = []
-                velocities = []
-                times = []
-                
-                # Propagate orbit
-                current_time = start_time
-                while current_time <= end_time:
-                    # Convert current time to Skyfield time
-                    t = ts.utc(
-                        current_time.year,
-                        current_time.month,
-                        current_time.day,
-                        current_time.hour,
-                        current_time.minute,
-                        current_time.second
-                    )
-                    
-                    # Get satellite position and velocity
-                    geocentric = satellite.at(t)
-                    subpoint = geocentric.subpoint()
-                    
-                    # Store results
-                    latitudes.append(float(subpoint.latitude.degrees))
-                    longitudes.append(float(subpoint.longitude.degrees))
-                    elevations.append(float(subpoint.elevation.m))
-                    
-                    # Get position (x, y, z) in kilometers
-                    position = geocentric.position.km
-                    positions.append({
-                        'x': float(position[0]),
-                        'y': float(position[1]),
-                        'z': float(position[2])
-                    })
-                    
-                    # Get velocity in km/s
-                    velocity = geocentric.velocity.km_per_s
-                    velocities.append({
-                        'x': float(velocity[0]),
-                        'y': float(velocity[1]),
-                        'z': float(velocity[2])
-                    })
-                    
-                    times.append(current_time.isoformat())
-                    
-                    # Increment time by step size
-                    current_time += timedelta(minutes=step_size)
-                
-                # Add to combined results
-                combined_results.append({
-                    'satellite_id': satellite_data['id'],
-                    'satellite_name': satellite_data['name'],
-                    'propagation_data': {
-                        'times': times,
-                        'latitudes': latitudes,
-                        'longitudes': longitudes,
-                        'elevations': elevations,
-                        'positions': positions,
-                        'velocities': velocities
-                    }
-                })
-                
-            except Exception as e:
-                # Log error but continue with other satellites
-                print(f"Error propagating satellite {satellite_data['name']}: {str(e)}")
-        
-        if not combined_results:
-            return jsonify({'error': 'Failed to propagate any satellites'}), 500
-        
-        # Create a combined ground track visualization
-        ground_track_fig = go.Figure()
-        
-        # Define a color palette for satellites
-        colors = [
-            '#1f77b4',  # blue
-            '#ff7f0e',  # orange
-            '#2ca02c',  # green
-            '#d62728',  # red
-            '#9467bd',  # purple
-            '#8c564b',  # brown
-            '#e377c2',  # pink
-            '#7f7f7f',  # gray
-            '#bcbd22',  # olive
-            '#17becf'   # teal
+        # Create a combined ground track visualization, one trace per satellite
+        # (cycling through the colors if there are more satellites than colors)
+        traces = [
+            _map_trace(latitudes[idx], longitudes[idx], TRACK_COLORS[idx % len(TRACK_COLORS)], name=result['satellite_name'])
+            for idx, result in enumerate(combined_results)
         ]
         
-        # Add ground tracks for each satellite
-        for idx, result in enumerate(combined_results):
-            # Assign a color for this satellite (cycle through the colors if more satellites than colors)
-            satellite_color = colors[idx % len(colors)]
-            
-            # Handle international date line crossing by splitting the data into segments
-            lat_segments = []
-            lon_segments = []
-            current_lat_segment = []
-            current_lon_segment = []
-            
-            for i in range(len(result['propagation_data']['longitudes'])):
-                # Add point to current segment
-                current_lat_segment.append(result['propagation_data']['latitudes'][i])
-                current_lon_segment.append(result['propagation_data']['longitudes'][i])
-                
-                # Check if we need to start a new segment (international date line crossing)
-                if i < len(result['propagation_data']['longitudes']) - 1:
-                    # If longitude difference is more than 180 degrees, we've crossed the date line
-                    if abs(result['propagation_data']['longitudes'][i+1] - result['propagation_data']['longitudes'][i]) > 180:
-                        # End current segment
-                        lat_segments.append(current_lat_segment)
-                        lon_segments.append(current_lon_segment)
-                        # Start new segment
-                        current_lat_segment = []
-                        current_lon_segment = []
-            
-            # Add the final segment if it has points
-            if current_lat_segment:
-                lat_segments.append(current_lat_segment)
-                lon_segments.append(current_lon_segment)
-            
-            # Create a trace for each segment
-            for i in range(len(lat_segments)):
-                # For the first segment, include the name for the legend
-                if i == 0:
-                    ground_track_fig.add_trace(
-                        go.Scattermapbox(
-                            mode="markers+lines",
-                            lon=lon_segments[i],
-                            lat=lat_segments[i],
-                            marker=dict(size=5, color=satellite_color),
-                            line=dict(width=2, color=satellite_color),
-                            name=result['satellite_name'],
-                        )
-                    )
-                else:
-                    # For additional segments, use the same color but don't add to legend
-                    ground_track_fig.add_trace(
-                        go.Scattermapbox(
-                            mode="markers+lines",
-                            lon=lon_segments[i],
-                            lat=lat_segments[i],
-                            marker=dict(size=5, color=satellite_color),
-                            line=dict(width=2, color=satellite_color),
-                            name=result['satellite_name'],
-                            showlegend=False,  # Don't show this in the legend
-                        )
-                    )
-        
         # Calculate center point (average of all lat/long points from all satellites)
-        all_lats = []
-        all_lons = []
-        for result in combined_results:
-            all_lats.extend(result['propagation_data']['latitudes'])
-            all_lons.extend(result['propagation_data']['longitudes'])
-        
-        center_lat = sum(all_lats) / len(all_lats) if all_lats else 0
-        center_lon = sum(all_lons) / len(all_lons) if all_lons else 0
-        
-        # Update layout with mapbox configuration
-        ground_track_fig.update_layout(
-            mapbox=dict(
-                style="white-bg",
-                layers=[
-                    {
-                        "below": "traces",
-                        "sourcetype": "raster",
-                        "sourceattribution": "United States Geological Survey",
-                        "source": [
-                            "https://basemap.nationalmap.gov/arcgis/rest/services/USGSImageryOnly/MapServer/tile/{z}/{y}/{x}"
-                        ]
-                    }
-                ],
-                center=dict(
-                    lon=center_lon,
-                    lat=center_lat
-                ),
-                zoom=1,
-                bearing=0,
-            ),
-            width=800,
-            height=700,
-            margin=dict(l=0, r=0, t=0, b=0),
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor="rgba(0,0,0,0.5)"
-            )
+        center_lat = float(latitudes.mean()) if latitudes.size else 0.0
+        center_lon = _center_longitude(longitudes)
+        
+        # Encode the figure with the mapbox configuration
+        ground_track_json = _map_figure_json(
+            traces,
+            mapbox={**_BASE_MAPBOX_LAYOUT, 'center': dict(lon=center_lon, lat=center_lat), 'zoom': 1},
+            legend=_COMBINED_LEGEND,
+            **_MAP_FIGURE_LAYOUT
         )
         
-        # Convert to JSON
-        ground_track_json = json.dumps(ground_track_fig, cls=plotly.utils.PlotlyJSONEncoder)
-        
-        # Return both plot data and propagation data
-        return jsonify({
+        # Return both plot data and propagation data, streaming one satellite at a time
+        return json_stream_response({
             'status': 'success',
-            'satellites_count': len(combined_results),
-            'ground_track_data': ground_track_json,
-            'propagation_results': combined_results
-        })
+            'satellites_count': len(combined_results)
+        }, 'propagation_results', combined_results, raw_members={'ground_track_data': ground_track_json})
     
     except Exception as e:
-        return jsonify({'error': f"Propagation failed: {str(e)}"}), 500
+        return json_response({'error': f"Propagation failed: {str(e)}"}, 500)
+
+def _center_longitude(longitudes):
+    """Return the circular mean of longitudes (deg), so tracks that cross the date line center near it"""
+    if not longitudes.size:
+        return 0.0
+    radians = np.radians(longitudes)
+    x = np.cos(radians).mean()
+    y = np.sin(radians).mean()
+    # Tracks spread around the whole globe have no meaningful mean direction; keep those at 0
+    if np.hypot(x, y) < 0.1:
+        return 0.0
+    return float(np.degrees(np.arctan2(y, x)))
+
+def _break_at_dateline(latitudes, longitudes):
+    """Insert NaN gaps into a ground track wherever it crosses the date line"""
+    # float32 is ~1 m at the equator, far finer than the map can show, and orjson writes
+    # it with about half the digits of float64, halving the figure JSON
+    lat = np.asarray(latitudes, dtype=np.float32)
+    lon = np.asarray(longitudes, dtype=np.float32)
+    
+    # A jump of more than 180 degrees between consecutive points is a date line crossing;
+    # Plotly leaves a gap at each NaN, so the segments stay disconnected within one trace
+    breaks = np.flatnonzero(np.abs(np.diff(lon)) > 180) + 1
+    return np.insert(lat, breaks, np.nan), np.insert(lon, breaks, np.nan)
 
 def plotly_map_plot(latitudes, longitudes, zoom=1, center=None):
-    """Create an interactive map with satellite ground track"""
+    """Create an interactive map with satellite ground track, as Plotly figure JSON"""
     if center is None:
         # Default center at [0, 0] if not provided
         center = [0, 0]
     
-    # Handle international date line crossing by splitting the data into segments
-    lat_segments = []
-    lon_segments = []
-    current_lat_segment = []
-    current_lon_segment = []
-    
-    for i in range(len(longitudes)):
-        # Add point to current segment
-        current_lat_segment.append(latitudes[i])
-        current_lon_segment.append(longitudes[i])
-        
-        # Check if we need to start a new segment (international date line crossing)
-        if i < len(longitudes) - 1:
-            # If longitude difference is more than 180 degrees, we've crossed the date line
-            if abs(longitudes[i+1] - longitudes[i]) > 180:
-                # End current segment
-                lat_segments.append(current_lat_segment)
-                lon_segments.append(current_lon_segment)
-                # Start new segment
-                current_lat_segment = []
-                current_lon_segment = []
-    
-    # Add the final segment if it has points
-    if current_lat_segment:
-        lat_segments.append(current_lat_segment)
-        lon_segments.append(current_lon_segment)
-    
-    # Create a trace for each segment
-    traces = []
-    for i in range(len(lat_segments)):
-        traces.append(
-            go.Scattermapbox(
-                mode="markers+lines",
-                lon=lon_segments[i],
-                lat=lat_segments[i],
-                marker=dict(size=5, color="#EDB120"),
-                line=dict(width=2, color="#EDB120"),
-                showlegend=False,
-            )
-        )
-    
-    # Create the figure with all traces
-    fig = go.Figure(data=traces)
-    
-    # Update layout with mapbox configuration
-    fig.update_layout(
-        mapbox=dict(
-            style="white-bg",
-            layers=[
-                {
-                    "below": "traces",
-                    "sourcetype": "raster",
-                    "sourceattribution": "United States Geological Survey",
-                    "source": [
-                        "https://basemap.nationalmap.gov/arcgis/rest/services/USGSImageryOnly/MapServer/tile/{z}/{y}/{x}"
-                    ]
-                }
-            ],
-            center=dict(
-                lon=center[0],
-                lat=center[1]
-            ),
-            zoom=zoom,
-            bearing=0,
-        ),
-        width=800,
-        height=700,
-        margin=dict(l=0, r=0, t=0, b=0),
+    trace = _map_trace(latitudes, longitudes, "#EDB120", showlegend=False)
+    return _map_figure_json(
+        [trace],
+        mapbox={**_BASE_MAPBOX_LAYOUT, 'center': dict(lon=center[0], lat=center[1]), 'zoom': zoom},
+        **_MAP_FIGURE_LAYOUT
     )
-    
-    return fig
 
-@app.route('/api/satellites/<int:satellite_id>/ground-track', methods=['POST'])
+@app.route('/api/satellites/<fint:satellite_id>/ground-track', methods=['POST'])
 def generate_ground_track(satellite_id):
     """Generate and return a ground track plot for a satellite after propagation"""
     # Get propagation parameters from request
     data = request.json
     
     if not data or 'start_time' not in data or 'end_time' not in data or 'step_size' not in data:
-        return jsonify({'error': 'Start time, end time, and step size are required'}), 400
+        return json_response({'error': 'Start time, end time, and step size are required'}, 400)
+    
+    # Optional downsampling (max_points) and paging (offset, limit) of the per-step arrays
+    paging = _requested_paging(data)
+    if paging is None:
+        return json_response({'error': 'max_points, offset and limit must be non-negative integers (max_points at least 1)'}, 400)
     
-    # Find the satellite by ID
-    satellite_data = None
-    for sat in satellites:
-        if sat['id'] == satellite_id:
-            satellite_data = sat
-            break
+    # Find the satellite and its parsed model by ID
+    satellite_data, satellite = _lookup_satellite(satellite_id)
     
     if not satellite_data:
-        return jsonify({'error': f"Satellite with ID {satellite_id} not found"}), 404
+        return json_response({'error': f"Satellite with ID {satellite_id} not found"}, 404)
     
     try:
         # Parse start and end times
@@ -521,951 +937,79 @@ def generate_ground_track(satellite_id):
         end_time = datetime.fromisoformat(data['end_time'])
         step_size = float(data['step_size'])  # In minutes
         
-        # Load Skyfield time scale
-        ts = load.timescale()
-        
-        # Parse TLE data
-        tle_lines = satellite_data['tle'].strip().split('\n')
-        if len(tle_lines) != 2:
-            return jsonify({'error': 'Invalid TLE data format'}), 400
-        
-        # Create Skyfield satellite object
-        satellite = EarthSatellite(tle_lines[0], tle_lines[1], satellite_data['name'], ts)
+        # Reject windows that can't be computed or would pin a worker
+        grid_error = _grid_error(start_time, end_time, step_size)
+        if grid_error:
+            return json_response({'error': grid_error}, 400)
         
-        # Initialize lists for results
-        latitudes = []
-        longitudes = []
-        times = []
+        # Reuse the Skyfield satellite object parsed when the satellite was created
+        if satellite is None:
+            return json_response({'error': 'Invalid TLE data format'}, 400)
         
-        # Propagate orbit
-        current_time = start_time
-        while current_time <= end_time:
-            # Convert current time to Skyfield time
-            t = ts.utc(
-                current_time.year,
-                current_time.month,
-                current_time.day,
-                current_time.hour,
-                current_time.minute,
-                current_time.second
-            )
-            
-            # Get satellite position
-            geocentric = satellite.at(t)
-            subpoint = geocentric.subpoint()
-            
-            # Store results
-            latitudes.append(float(subpoint.latitude.degrees))
-            longitudes.append(float(subpoint.longitude.degrees))
-            times.append(current_time.isoformat())
-            
-            # Increment time by step size
-            current_time += timedelta(minutes=step_size)
+        # Propagate orbit over the whole time grid in one call (or reuse a cached track)
+        track = _propagate_track(satellite, start_time, end_time, step_size)
+        latitudes = track.latitudes
+        longitudes = track.longitudes
         
         # Calculate center point (average of all lat/long points)
-        center_lat = sum(latitudes) / len(latitudes)
-        center_lon = sum(longitudes) / len(longitudes)
+        center_lat = float(latitudes.mean()) if latitudes.size else 0.0
+        center_lon = _center_longitude(longitudes)
         
-        # Create the plot
-        fig = plotly_map_plot(latitudes, longitudes, zoom=2, center=[center_lon, center_lat])
+        # Create the plot from at most MAP_MAX_POINTS evenly spaced points
+        map_selection, _ = _page_slice(len(latitudes), MAP_MAX_POINTS, 0, None)
+        plot_json = plotly_map_plot(latitudes[map_selection], longitudes[map_selection], zoom=2, center=[center_lon, center_lat])
         
-        # Convert to JSON
-        plot_json = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
-        
-        # Return both plot data and propagation data
-        return jsonify({
+        # Return both plot data and the requested page of propagation data
+        selection, total_points = _page_slice(len(latitudes), *paging)
+        return etag_json_response({
             'satellite_id': satellite_id,
-            'satellite_name': satellite_data['name'],
-            'plot_data': plot_json,
+            'satellite_name': satellite_data.name,
+            'total_points': total_points,
             'propagation_data': {
-                'times': times,
-                'latitudes': latitudes,
-                'longitudes': longitudes
+                'times': _take(track.grid.times, selection),
+                'latitudes': _wire(_take(latitudes, selection)),
+                'longitudes': _wire(_take(longitudes, selection))
             }
-        })
+        }, raw_members={'plot_data': plot_json})
     
     except Exception as e:
-        return jsonify({'error': f"Ground track generation failed: {str(e)}"}), 500
-
-# HTML template for the main page
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Orbital Propagation App</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #121212;
-            color: white;
-        }
-        .container {
-            max-width: 800px;
-            margin: 0 auto;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 20px;
-        }
-        .card {
-            background-color: #1e1e1e;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-        .success {
-            color: #4caf50;
-            font-weight: bold;
-        }
-        .error {
-            color: #f44336;
-            font-weight: bold;
-        }
-        button {
-            background-color: #00b0ff;
-            color: white;
-            border: none;
-            padding: 10px 15px;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 16px;
-            margin-top: 10px;
-        }
-        button:hover {
-            background-color: #0091ea;
-        }
-        input, textarea {
-            width: 100%;
-            padding: 10px;
-            margin: 8px 0;
-            box-sizing: border-box;
-            border-radius: 4px;
-            border: 1px solid #555;
-            background-color: #2d2d2d;
-            color: white;
-        }
-        label {
-            margin-top: 10px;
-            display: block;
-            font-weight: bold;
-        }
-        .satellite-list {
-            list-style-type: none;
-            padding: 0;
-        }
-        .satellite-item {
-            padding: 10px;
-            border-bottom: 1px solid #333;
-        }
-        .satellite-item:last-child {
-            border-bottom: none;
-        }
-        .tle-data {
-            font-family: monospace;
-            white-space: pre;
-            background-color: #2d2d2d;
-            padding: 8px;
-            border-radius: 4px;
-            overflow-x: auto;
-        }
-        h2 {
-            color: #00b0ff;
-        }
-        .delete-btn {
-            background-color: #f44336;
-            margin-top: 10px;
-        }
-        .delete-btn:hover {
-            background-color: #d32f2f;
-        }
-        .button-container {
-            display: flex;
-            gap: 10px;
-            margin-top: 10px;
-        }
-        
-        .propagate-btn {
-            background-color: #69f0ae;
-            color: black;
-            margin-top: 10px;
-        }
-        
-        .propagate-btn:hover {
-            background-color: #4caf50;
-        }
-        
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            overflow: auto;
-            background-color: rgba(0,0,0,0.8);
-        }
-        
-        .modal-content {
-            background-color: #1e1e1e;
-            margin: 15% auto;
-            padding: 20px;
-            border-radius: 8px;
-            width: 80%;
-            max-width: 600px;
-        }
-        
-        .close {
-            color: #aaa;
-            float: right;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-        }
-        
-        .close:hover {
-            color: white;
-        }
-        
-        .form-row {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 15px;
-        }
-        
-        .form-row > div {
-            flex: 1;
-        }
-        
-        .results-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }
-        
-        .results-table th {
-            background-color: #2d2d2d;
-            text-align: left;
-            padding: 8px;
-        }
-        
-        .results-table td {
-            padding: 8px;
-            border-bottom: 1px solid #333;
-        }
-        
-        .ground-track-btn {
-            background-color: #8e44ad;
-            color: white;
-            margin-left: 10px;
-        }
-        
-        .ground-track-btn:hover {
-            background-color: #6c3483;
-        }
-        
-        .plot-container {
-            width: 100%;
-            height: 700px;
-            margin-top: 20px;
-        }
-        
-        .ground-track-modal .modal-content {
-            width: 90%;
-            max-width: 900px;
-            margin: 5% auto;
-        }
-        
-        .modal-tabs {
-            display: flex;
-            border-bottom: 1px solid #333;
-            margin-bottom: 15px;
-        }
-        
-        .modal-tab {
-            padding: 10px 20px;
-            cursor: pointer;
-            background-color: #2d2d2d;
-            margin-right: 5px;
-            border-radius: 5px 5px 0 0;
-        }
-        
-        .modal-tab.active {
-            background-color: #00b0ff;
-            color: white;
-        }
-        
-        .tab-content {
-            display: none;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Orbital Propagation App</h1>
-        </div>
-
-        <!-- Backend Status -->
-        <div class="card" id="status-card">
-            <h2>Backend Status</h2>
-            <div id="status">Checking connection...</div>
-            <button onclick="checkHealth()">Refresh Status</button>
-        </div>
-
-        <!-- Add Satellite Form -->
-        <div class="card">
-            <h2>Add New Satellite</h2>
-            <form id="satellite-form">
-                <label for="satellite-name">Satellite Name:</label>
-                <input type="text" id="satellite-name" required placeholder="Enter satellite name">
-                
-                <label for="tle-data">TLE Data:</label>
-                <textarea id="tle-data" rows="3" required placeholder="Enter TLE data (Two-Line Element Set)"></textarea>
-                <div class="help-text">Enter the complete TLE data for the satellite (two lines)</div>
-                
-                <div id="form-status"></div>
-                
-                <button type="submit">Add Satellite</button>
-            </form>
-        </div>
-
-        <!-- Satellite List -->
-        <div class="card">
-            <h2>Satellite List</h2>
-            <div id="satellite-container">
-                <div>Loading satellites...</div>
-            </div>
-            <button onclick="fetchSatellites()">Refresh List</button>
-            <button onclick="openPropagateAllModal()" class="propagate-btn" id="propagate-all-btn" style="display: none; margin-left: 10px;">Propagate All Satellites</button>
-        </div>
-        
-        <!-- Propagation Modal -->
-        <div id="propagation-modal" class="modal">
-            <div class="modal-content">
-                <span class="close" onclick="closeModal('propagation-modal')">&times;</span>
-                <h2>Propagate Satellite Orbit</h2>
-                <div id="propagation-form">
-                    <div id="selected-satellite-name"></div>
-                    <div class="form-row">
-                        <div>
-                            <label for="start-time">Start Time:</label>
-                            <input type="datetime-local" id="start-time" required>
-                        </div>
-                        <div>
-                            <label for="end-time">End Time:</label>
-                            <input type="datetime-local" id="end-time" required>
-                        </div>
-                    </div>
-                    <div>
-                        <label for="step-size">Step Size (minutes):</label>
-                        <input type="number" id="step-size" value="0.2" min="0.1" step="0.1" required>
-                        <div class="help-text">Time interval between propagation points in minutes</div>
-                    </div>
-                    <div id="propagation-status"></div>
-                    <div style="display: flex; gap: 10px; margin-top: 15px;">
-                        <button onclick="propagateSatellite()" class="propagate-btn">Propagate</button>
-                        <button onclick="generateGroundTrack()" class="ground-track-btn">Propagate with Ground Track</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Results Modal -->
-        <div id="results-modal" class="modal">
-            <div class="modal-content">
-                <span class="close" onclick="closeModal('results-modal')">&times;</span>
-                <h2>Propagation Results</h2>
-                <div id="results-container">
-                    <!-- Results will be displayed here -->
-                </div>
-            </div>
-        </div>
-        
-        <!-- Ground Track Modal -->
-        <div id="ground-track-modal" class="modal ground-track-modal">
-            <div class="modal-content">
-                <span class="close" onclick="closeModal('ground-track-modal')">&times;</span>
-                <h2>Ground Track Visualization</h2>
-                
-                <div class="modal-tabs">
-                    <div class="modal-tab active" onclick="switchTab('map-tab')">Map View</div>
-                    <div class="modal-tab" onclick="switchTab('data-tab')">Data View</div>
-                </div>
-                
-                <div id="map-tab" class="tab-content active">
-                    <div id="ground-track-container" class="plot-container">
-                        <!-- Ground track map will be displayed here -->
-                    </div>
-                </div>
-                
-                <div id="data-tab" class="tab-content">
-                    <div id="ground-track-data">
-                        <!-- Ground track data will be displayed here -->
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Propagate All Modal -->
-        <div id="propagate-all-modal" class="modal">
-            <div class="modal-content">
-                <span class="close" onclick="closeModal('propagate-all-modal')">&times;</span>
-                <h2>Propagate All Satellite Orbits</h2>
-                <div id="propagate-all-form">
-                    <p>This will propagate the orbits of all satellites and generate a combined visualization.</p>
-                    <div class="form-row">
-                        <div>
-                            <label for="all-start-time">Start Time:</label>
-                            <input type="datetime-local" id="all-start-time" required>
-                        </div>
-                        <div>
-                            <label for="all-end-time">End Time:</label>
-                            <input type="datetime-local" id="all-end-time" required>
-                        </div>
-                    </div>
-                    <div>
-                        <label for="all-step-size">Step Size (minutes):</label>
-                        <input type="number" id="all-step-size" value="0.2" min="0.1" step="0.1" required>
-                        <div class="help-text">Time interval between propagation points in minutes</div>
-                    </div>
-                    <div id="propagate-all-status"></div>
-                    <div style="margin-top: 15px;">
-                        <button onclick="propagateAllSatellites()" class="propagate-btn">Propagate All Satellites</button>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Combined Results Modal -->
-        <div id="combined-results-modal" class="modal ground-track-modal">
-            <div class="modal-content">
-                <span class="close" onclick="closeModal('combined-results-modal')">&times;</span>
-                <h2>Combined Propagation Results</h2>
-                
-                <div class="modal-tabs">
-                    <div class="modal-tab active" onclick="switchCombinedTab('combined-map-tab')">Ground Track</div>
-                    <div class="modal-tab" onclick="switchCombinedTab('combined-data-tab')">Data</div>
-                </div>
-                
-                <div id="combined-map-tab" class="tab-content active">
-                    <div id="combined-ground-track-container" class="plot-container"></div>
-                </div>
-                
-                <div id="combined-data-tab" class="tab-content">
-                    <div id="combined-results-container">
-                        <!-- Combined results data will be displayed here -->
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Global variables for propagation
-        let selectedSatelliteId = null;
-        let selectedSatelliteName = null;
-        let propagationResults = null;
-        let groundTrackResults = null;
-        let combinedResults = null;
-        
-        // Function to check the health of the backend
-        function checkHealth() {
-            document.getElementById('status').innerHTML = 'Checking connection...';
-            
-            fetch('/api/health')
-                .then(response => response.json())
-                .then(data => {
-                    const statusElement = document.getElementById('status');
-                    statusElement.innerHTML = `
-                        <p class="success">Connected to backend successfully!</p>
-                        <p>Status: ${data.status}</p>
-                        <p>Message: ${data.message}</p>
-                        <p style="color: #888;">Timestamp: ${new Date(data.timestamp).toLocaleString()}</p>
-                    `;
-                })
-                .catch(error => {
-                    document.getElementById('status').innerHTML = `
-                        <p class="error">Error connecting to the backend</p>
-                        <p>${error.message}</p>
-                    `;
-                });
-        }
-
-        // Function to fetch all satellites
-        function fetchSatellites() {
-            const container = document.getElementById('satellite-container');
-            container.innerHTML = '<div>Loading satellites...</div>';
-            
-            fetch('/api/satellites')
-                .then(response => response.json())
-                .then(satellites => {
-                    if (satellites.length === 0) {
-                        container.innerHTML = '<div>No satellites added yet.</div>';
-                        document.getElementById('propagate-all-btn').style.display = 'none';
-                    } else {
-                        let html = '<ul class="satellite-list">';
-                        satellites.forEach(satellite => {
-                            html += `
-                                <li class="satellite-item">
-                                    <h3>${satellite.name}</h3>
-                                    <div><strong>TLE Data:</strong></div>
-                                    <div class="tle-data">${satellite.tle}</div>
-                                    <div style="color: #888;">Added: ${new Date(satellite.created_at).toLocaleString()}</div>
-                                    <div class="button-container">
-                                        <button class="delete-btn" onclick="deleteSatellite(${satellite.id})">Delete Satellite</button>
-                                        <button class="propagate-btn" onclick="openPropagationModal(${satellite.id}, '${satellite.name}')">Propagate Orbit</button>
-                                    </div>
-                                </li>
-                            `;
-                        });
-                        html += '</ul>';
-                        container.innerHTML = html;
-                        document.getElementById('propagate-all-btn').style.display = 'inline-block';
-                    }
-                })
-                .catch(error => {
-                    container.innerHTML = `<div class="error">Error fetching satellites: ${error.message}</div>`;
-                    document.getElementById('propagate-all-btn').style.display = 'none';
-                });
-        }
-
-        // Function to add a new satellite
-        document.getElementById('satellite-form').addEventListener('submit', function(e) {
-            e.preventDefault();
-            
-            const name = document.getElementById('satellite-name').value;
-            const tle = document.getElementById('tle-data').value;
-            const statusElement = document.getElementById('form-status');
-            
-            statusElement.innerHTML = '<div>Adding satellite...</div>';
-            
-            fetch('/api/satellites', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ name, tle }),
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(err => { throw new Error(err.error || 'Failed to add satellite'); });
-                }
-                return response.json();
-            })
-            .then(data => {
-                // Reset form
-                document.getElementById('satellite-name').value = '';
-                document.getElementById('tle-data').value = '';
-                
-                statusElement.innerHTML = '<div class="success">Satellite added successfully!</div>';
-                
-                // Refresh satellite list
-                fetchSatellites();
-            })
-            .catch(error => {
-                statusElement.innerHTML = `<div class="error">Error: ${error.message}</div>`;
-            });
-        });
-
-        // Function to delete a satellite
-        function deleteSatellite(id) {
-            if (!confirm('Are you sure you want to delete this satellite?')) {
-                return;
-            }
-            
-            fetch(`/api/satellites/${id}`, {
-                method: 'DELETE',
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(err => { throw new Error(err.error || 'Failed to delete satellite'); });
-                }
-                return response.json();
-            })
-            .then(data => {
-                alert(data.message);
-                // Refresh satellite list
-                fetchSatellites();
-            })
-            .catch(error => {
-                alert(`Error: ${error.message}`);
-            });
-        }
+        return json_response({'error': f"Ground track generation failed: {str(e)}"}, 500)
 
-        // Function to open propagation modal
-        function openPropagationModal(satelliteId, satelliteName) {
-            selectedSatelliteId = satelliteId;
-            selectedSatelliteName = satelliteName;
-            
-            // Set default times (now to 24 hours from now)
-            const now = new Date();
-            const tomorrow = new Date(now);
-            tomorrow.setHours(tomorrow.getHours() + 24);
-            
-            document.getElementById('selected-satellite-name').innerHTML = `<h3>Satellite: ${satelliteName}</h3>`;
-            document.getElementById('start-time').value = now.toISOString().slice(0, 16);
-            document.getElementById('end-time').value = tomorrow.toISOString().slice(0, 16);
-            document.getElementById('step-size').value = '0.2';
-            document.getElementById('propagation-status').innerHTML = '';
-            
-            document.getElementById('propagation-modal').style.display = 'block';
-        }
-        
-        // Function to close modals
-        function closeModal(modalId) {
-            document.getElementById(modalId).style.display = 'none';
-        }
-        
-        // Function to propagate satellite
-        function propagateSatellite() {
-            const startTime = document.getElementById('start-time').value;
-            const endTime = document.getElementById('end-time').value;
-            const stepSize = document.getElementById('step-size').value;
-            const statusElement = document.getElementById('propagation-status');
-            
-            if (!startTime || !endTime || !stepSize) {
-                statusElement.innerHTML = '<div class="error">All fields are required</div>';
-                return;
-            }
-            
-            statusElement.innerHTML = '<div>Propagating orbit...</div>';
-            
-            fetch(`/api/satellites/${selectedSatelliteId}/propagate`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    start_time: startTime,
-                    end_time: endTime,
-                    step_size: parseFloat(stepSize)
-                }),
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(err => { throw new Error(err.error || 'Failed to propagate orbit'); });
-                }
-                return response.json();
-            })
-            .then(data => {
-                propagationResults = data;
-                closeModal('propagation-modal');
-                displayResults();
-            })
-            .catch(error => {
-                statusElement.innerHTML = `<div class="error">Error: ${error.message}</div>`;
-            });
-        }
-        
-        // Function to generate ground track
-        function generateGroundTrack() {
-            const startTime = document.getElementById('start-time').value;
-            const endTime = document.getElementById('end-time').value;
-            const stepSize = document.getElementById('step-size').value;
-            const statusElement = document.getElementById('propagation-status');
-            
-            if (!startTime || !endTime || !stepSize) {
-                statusElement.innerHTML = '<div class="error">All fields are required</div>';
-                return;
-            }
-            
-            statusElement.innerHTML = '<div>Generating ground track...</div>';
-            
-            fetch(`/api/satellites/${selectedSatelliteId}/ground-track`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    start_time: startTime,
-                    end_time: endTime,
-                    step_size: parseFloat(stepSize)
-                }),
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(err => { throw new Error(err.error || 'Failed to generate ground track'); });
-                }
-                return response.json();
-            })
-            .then(data => {
-                groundTrackResults = data;
-                closeModal('propagation-modal');
-                displayGroundTrack();
-            })
-            .catch(error => {
-                statusElement.innerHTML = `<div class="error">Error: ${error.message}</div>`;
-            });
-        }
-        
-        // Function to display propagation results
-        function displayResults() {
-            const resultsContainer = document.getElementById('results-container');
-            
-            let html = `
-                <h3>${propagationResults.satellite_name}</h3>
-                <h4>Propagation Summary</h4>
-                <p>Total points: ${propagationResults.propagation_data.times.length}</p>
-                <p>Start time: ${new Date(propagationResults.propagation_data.times[0]).toLocaleString()}</p>
-                <p>End time: ${new Date(propagationResults.propagation_data.times[propagationResults.propagation_data.times.length - 1]).toLocaleString()}</p>
-                
-                <h4>Position and Velocity Data (First 5 points)</h4>
-                <table class="results-table">
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Latitude (°)</th>
-                            <th>Longitude (°)</th>
-                            <th>Elevation (m)</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            `;
-            
-            // Add first 5 rows of data
-            const maxRows = Math.min(5, propagationResults.propagation_data.times.length);
-            for (let i = 0; i < maxRows; i++) {
-                html += `
-                    <tr>
-                        <td>${new Date(propagationResults.propagation_data.times[i]).toLocaleString()}</td>
-                        <td>${propagationResults.propagation_data.latitudes[i].toFixed(4)}</td>
-                        <td>${propagationResults.propagation_data.longitudes[i].toFixed(4)}</td>
-                        <td>${propagationResults.propagation_data.elevations[i].toFixed(2)}</td>
-                    </tr>
-                `;
-            }
-            
-            html += `
-                    </tbody>
-                </table>
-                <div style="margin-top: 15px; color: #69f0ae;">
-                    The complete propagation data can be analyzed and visualized using appropriate tools.
-                </div>
-            `;
-            
-            resultsContainer.innerHTML = html;
-            document.getElementById('results-modal').style.display = 'block';
-        }
-        
-        // Function to display ground track
-        function displayGroundTrack() {
-            // Display the map
-            const plotData = JSON.parse(groundTrackResults.plot_data);
-            Plotly.newPlot('ground-track-container', plotData.data, plotData.layout);
-            
-            // Display data in the data tab
-            const dataContainer = document.getElementById('ground-track-data');
-            
-            let html = `
-                <h3>${groundTrackResults.satellite_name}</h3>
-                <h4>Ground Track Summary</h4>
-                <p>Total points: ${groundTrackResults.propagation_data.times.length}</p>
-                <p>Start time: ${new Date(groundTrackResults.propagation_data.times[0]).toLocaleString()}</p>
-                <p>End time: ${new Date(groundTrackResults.propagation_data.times[groundTrackResults.propagation_data.times.length - 1]).toLocaleString()}</p>
-                
-                <h4>Ground Track Data</h4>
-                <table class="results-table">
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Latitude (°)</th>
-                            <th>Longitude (°)</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            `;
-            
-            // Add rows of data
-            const maxRows = Math.min(20, groundTrackResults.propagation_data.times.length);
-            for (let i = 0; i < maxRows; i++) {
-                html += `
-                    <tr>
-                        <td>${new Date(groundTrackResults.propagation_data.times[i]).toLocaleString()}</td>
-                        <td>${groundTrackResults.propagation_data.latitudes[i].toFixed(4)}</td>
-                        <td>${groundTrackResults.propagation_data.longitudes[i].toFixed(4)}</td>
-                    </tr>
-                `;
-            }
-            
-            html += `
-                    </tbody>
-                </table>
-                <div style="margin-top: 15px; color: #69f0ae;">
-                    Showing ${maxRows} of ${groundTrackResults.propagation_data.times.length} points.
-                </div>
-            `;
-            
-            dataContainer.innerHTML = html;
-            
-            // Show the ground track modal
-            document.getElementById('ground-track-modal').style.display = 'block';
-        }
-        
-        // Function to switch tabs
-        function switchTab(tabId) {
-            // Hide all tab contents
-            const tabContents = document.querySelectorAll('.tab-content');
-            tabContents.forEach(tab => tab.classList.remove('active'));
-            
-            // Deactivate all tabs
-            const tabs = document.querySelectorAll('.modal-tab');
-            tabs.forEach(tab => tab.classList.remove('active'));
-            
-            // Activate the selected tab
-            document.getElementById(tabId).classList.add('active');
-            
-            // Activate the tab button
-            const tabIndex = tabId === 'map-tab' ? 0 : 1;
-            tabs[tabIndex].classList.add('active');
-        }
-        
-        // Function to open propagate all modal
-        function openPropagateAllModal() {
-            // Set default times (now to 24 hours from now)
-            const now = new Date();
-            const tomorrow = new Date(now);
-            tomorrow.setHours(tomorrow.getHours() + 24);
-            
-            document.getElementById('all-start-time').value = now.toISOString().slice(0, 16);
-            document.getElementById('all-end-time').value = tomorrow.toISOString().slice(0, 16);
-            document.getElementById('all-step-size').value = '0.2';
-            document.getElementById('propagate-all-status').innerHTML = '';
-            
-            document.getElementById('propagate-all-modal').style.display = 'block';
-        }
-        
-        // Function to propagate all satellites
-        function propagateAllSatellites() {
-            const startTime = document.getElementById('all-start-time').value;
-            const endTime = document.getElementById('all-end-time').value;
-            const stepSize = document.getElementById('all-step-size').value;
-            const statusElement = document.getElementById('propagate-all-status');
-            
-            if (!startTime || !endTime || !stepSize) {
-                statusElement.innerHTML = '<div class="error">All fields are required</div>';
-                return;
-            }
-            
-            statusElement.innerHTML = '<div>Propagating all orbits...</div>';
-            
-            fetch('/api/satellites/propagate-all', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    start_time: startTime,
-                    end_time: endTime,
-                    step_size: parseFloat(stepSize)
-                }),
-            })
-            .then(response => {
-                if (!response.ok) {
-                    return response.json().then(err => { throw new Error(err.error || 'Failed to propagate orbits'); });
-                }
-                return response.json();
-            })
-            .then(data => {
-                combinedResults = data;
-                closeModal('propagate-all-modal');
-                displayCombinedResults();
-            })
-            .catch(error => {
-                statusElement.innerHTML = `<div class="error">Error: ${error.message}</div>`;
-            });
-        }
-        
-        // Function to display combined results
-        function displayCombinedResults() {
-            // Prepare the data tab content
-            const resultsContainer = document.getElementById('combined-results-container');
-            
-            let html = `
-                <h3>Propagated ${combinedResults.satellites_count} Satellites</h3>
-                
-                <h4>Satellite Details:</h4>
-                <ul class="satellite-list">
-            `;
-            
-            combinedResults.propagation_results.forEach(result => {
-                html += `
-                    <li class="satellite-item">
-                        <h3>${result.satellite_name}</h3>
-                        <p>Satellite ID: ${result.satellite_id}</p>
-                        <p>Data points: ${result.propagation_data.times.length}</p>
-                        <p>Start time: ${new Date(result.propagation_data.times[0]).toLocaleString()}</p>
-                        <p>End time: ${new Date(result.propagation_data.times[result.propagation_data.times.length - 1]).toLocaleString()}</p>
-                    </li>
-                `;
-            });
-            
-            html += `
-                </ul>
-            `;
-            
-            resultsContainer.innerHTML = html;
-            
-            // Create the ground track map
-            const groundTrackData = JSON.parse(combinedResults.ground_track_data);
-            Plotly.newPlot('combined-ground-track-container', groundTrackData.data, groundTrackData.layout);
-            
-            // Set the active tab to ground track by default
-            switchCombinedTab('combined-map-tab');
-            
-            // Show the combined results modal
-            document.getElementById('combined-results-modal').style.display = 'block';
-        }
-        
-        // Function to switch tabs in the combined results modal
-        function switchCombinedTab(tabId) {
-            // Hide all tab contents
-            const tabContents = document.querySelectorAll('#combined-results-modal .tab-content');
-            tabContents.forEach(tab => tab.classList.remove('active'));
-            
-            // Deactivate all tabs
-            const tabs = document.querySelectorAll('#combined-results-modal .modal-tab');
-            tabs.forEach(tab => tab.classList.remove('active'));
-            
-            // Activate the selected tab
-            document.getElementById(tabId).classList.add('active');
-            
-            // Activate the tab button
-            let tabIndex = 0;
-            if (tabId === 'combined-data-tab') tabIndex = 1;
-            
-            tabs[tabIndex].classList.add('active');
-            
-            // Resize plots after tab switch to ensure they render correctly
-            window.dispatchEvent(new Event('resize'));
-        }
-
-        // Initialize the page
-        document.addEventListener('DOMContentLoaded', function() {
-            checkHealth();
-            fetchSatellites();
-        });
-    </script>
-</body>
-</html>
-"""
-
-@app.route('/')
-def index():
-    return render_template_string(HTML_TEMPLATE)
+# The frontend is served from the minified, precompressed build in static/dist.
+# Behind a reverse proxy that serves static/dist itself, set SERVE_FRONTEND=0
+# so Flask only handles /api/*.
+if os.environ.get('SERVE_FRONTEND', '1') == '1':
+    @app.route('/')
+    def index():
+        """Serve the minified frontend from disk, precompressed when the client accepts it"""
+        # Built on first use rather than at import; afterwards this is just an mtime check
+        build_index()
+        
+        if 'br' in request.accept_encodings:
+            filename, encoding = 'index.html.br', 'br'
+        elif 'gzip' in request.accept_encodings:
+            filename, encoding = 'index.html.gz', 'gzip'
+        else:
+            filename, encoding = 'index.html', None
+        
+        response = send_from_directory(
+            DIST_DIR, filename, mimetype='text/html', download_name='index.html', max_age=3600
+        )
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
 
 if __name__ == '__main__':
+    build_index()
     port = int(os.environ.get('PORT', 5000))
     print(f"Starting Flask server on port {port}...")
     print(f"Open http://localhost:{port} in your browser to view the application")
-    app.run(host='0.0.0.0', port=port, debug=True) 
\ No newline at end of file
+    if os.environ.get('FLASK_DEBUG') == '1':
+        # Werkzeug's single-threaded reloading server, for local development only
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        import uvicorn
+        # Keep idle connections open long enough for the page's follow-up requests
+        uvicorn.run(asgi_app, host='0.0.0.0', port=port, log_level='info', timeout_keep_alive=30)
+ 
\ No newline at end of file
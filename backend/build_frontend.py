@@ -0,0 +1,47 @@
+"""Build the minified and precompressed frontend served by Flask or a reverse proxy
+
+Run from the backend directory to (re)generate static/dist/:
+    python build_frontend.py
+"""
+import gzip
+import os
+import re
+
+import brotli
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+
+def minify_html(html):
+    """Strip comments, indentation and blank lines from the frontend markup"""
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
+    lines = (line.strip() for line in html.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+def _write_atomic(path, data):
+    """Write then rename so concurrently starting workers never serve a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def build_index(force=False):
+    """Write dist/index.html (+ .gz and .br) if missing or older than static/index.html"""
+    source = os.path.join(STATIC_DIR, 'index.html')
+    target = os.path.join(DIST_DIR, 'index.html')
+    # The brotli copy is written last, so it tells us whether the build is complete
+    marker = target + '.br'
+    if not force and os.path.exists(marker) and os.path.getmtime(marker) >= os.path.getmtime(source):
+        return
+    
+    os.makedirs(DIST_DIR, exist_ok=True)
+    with open(source, encoding='utf-8') as f:
+        minified = minify_html(f.read()).encode('utf-8')
+    
+    _write_atomic(target, minified)
+    _write_atomic(target + '.gz', gzip.compress(minified, compresslevel=9, mtime=0))
+    _write_atomic(marker, brotli.compress(minified, quality=11))
+
+if __name__ == '__main__':
+    build_index(force=True)
+    print(f"Frontend written to {DIST_DIR}")
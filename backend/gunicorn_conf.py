@@ -0,0 +1,28 @@
+"""Gunicorn settings for serving the backend with gevent workers
+
+Run from the backend directory:
+    gunicorn -c gunicorn_conf.py app:app
+"""
+# Patch sockets/ssl before anything else imports them so requests can
+# overlap network I/O inside each worker
+from gevent import monkey
+monkey.patch_all()
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_connections = 1000
+# Reuse client connections across the page's back-to-back API requests
+keepalive = 30
+
+# Import the app (timescale) once in the master and fork it;
+# each worker opens its own SQLite connection on first use
+preload_app = True
+
+def on_starting(server):
+    """Build the frontend once in the master, before any worker serves it"""
+    from build_frontend import build_index
+    build_index()
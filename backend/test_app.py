@@ -0,0 +1,142 @@
+"""Regression tests for the backend API
+
+Run from the backend directory:
+    python -m pytest -q
+"""
+from datetime import datetime
+
+import numpy as np
+
+import app as backend
+
+# Testing mode keeps the satellites in an in-memory database
+backend.app.testing = True
+
+ISS_TLE = (
+    "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927\n"
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+)
+
+def test_same_instant_with_different_offsets_is_not_shared():
+    """Equal-instant windows written with different UTC offsets keep their own grids and labels"""
+    client = backend.app.test_client()
+    satellite_id = client.post('/api/satellites', json={'name': 'ISS', 'tle': ISS_TLE}).get_json()['id']
+    
+    results = []
+    for start_time in ('2024-01-01T00:00:00+05:00', '2023-12-31T19:00:00+00:00'):
+        response = client.post(f'/api/satellites/{satellite_id}/propagate', json={
+            'start_time': start_time,
+            'end_time': '2024-01-01T01:00:00+05:00',
+            'step_size': 1
+        })
+        assert response.status_code == 200
+        results.append(response.get_json()['propagation_data'])
+    
+    assert results[0]['times'][0] == '2024-01-01T00:00:00+05:00'
+    assert results[1]['times'][0] == '2023-12-31T19:00:00+00:00'
+    assert results[0]['latitudes'][0] != results[1]['latitudes'][0]
+    
+    # The shared time grid itself must not alias either
+    grids = [
+        backend._time_grid(datetime.fromisoformat(start), datetime.fromisoformat(end), 1)
+        for start, end in (
+            ('2024-01-01T00:00:00+05:00', '2024-01-01T01:00:00+05:00'),
+            ('2023-12-31T19:00:00+00:00', '2024-01-01T01:00:00+05:00'),
+        )
+    ]
+    assert grids[0].times[0] != grids[1].times[0]
+
+def test_streamed_responses_use_brotli_or_gzip():
+    """Streamed propagation responses follow the same br-then-gzip preference as buffered ones"""
+    client = backend.app.test_client()
+    satellite_id = client.post('/api/satellites', json={'name': 'ISS', 'tle': ISS_TLE}).get_json()['id']
+    body = {'start_time': '2008-09-20T12:00', 'end_time': '2008-09-21T12:00', 'step_size': 1}
+    
+    for url in (f'/api/satellites/{satellite_id}/propagate?format=ndjson', '/api/satellites/propagate-all'):
+        for accept_encoding, expected in (('gzip, deflate, br, zstd', 'br'), ('gzip, deflate', 'gzip'), ('identity', None)):
+            # Closing the response finishes the stream inside its own request context
+            with client.post(url, json=body, headers={'Accept-Encoding': accept_encoding}) as response:
+                assert response.status_code == 200
+                assert response.headers.get('Content-Encoding') == expected
+
+def test_subpoints_and_state_vectors_match_skyfield():
+    """The vectorized TEME rotations and geodetic iteration agree with Skyfield's own frame code"""
+    satellite = backend.EarthSatellite(*ISS_TLE.splitlines(), 'ISS', backend.TS)
+    grid = backend._time_grid(datetime(2008, 9, 20, 12), datetime(2008, 9, 21, 12), 1)
+    r_teme, v_teme = backend._propagate_teme([satellite.model], grid)
+    latitudes, longitudes, elevations = backend._teme_subpoints(r_teme, grid)
+    positions, velocities = backend._teme_to_gcrs(r_teme, v_teme, grid)
+    
+    geocentric = satellite.at(grid.t)
+    subpoint = backend.iers2010.subpoint(geocentric)
+    longitude_error = (longitudes[0] - subpoint.longitude.degrees + 180.0) % 360.0 - 180.0
+    assert np.abs(latitudes[0] - subpoint.latitude.degrees).max() < 1e-10
+    assert np.abs(longitude_error).max() < 1e-10
+    assert np.abs(elevations[0] - subpoint.elevation.m).max() < 1e-6
+    assert np.abs(positions[0] - geocentric.position.km).max() < 1e-9
+    assert np.abs(velocities[0] - geocentric.velocity.km_per_s).max() < 1e-12
+
+def test_unacceptable_windows_are_rejected():
+    """Every propagation endpoint answers 400 for windows it can't or shouldn't compute"""
+    client = backend.app.test_client()
+    satellite_id = client.post('/api/satellites', json={'name': 'ISS', 'tle': ISS_TLE}).get_json()['id']
+    urls = (
+        f'/api/satellites/{satellite_id}/propagate',
+        f'/api/satellites/{satellite_id}/ground-track',
+        '/api/satellites/propagate-all'
+    )
+    # (start_time, end_time, step_size, part of the expected error)
+    windows = (
+        ('2008-09-20T12:00', '2008-09-20T13:00', 0.01, 'step_size'),
+        ('2008-09-20T12:00', '2008-09-20T13:00', 'nan', 'step_size'),
+        ('2008-09-20T12:00', '2008-09-20T13:00', 'inf', 'step_size'),
+        ('2008-09-20T12:00', '2008-09-27T10:40', 0.05, 'more than 200000 steps'),  # 200,001 points
+        ('2008-09-20T13:00', '2008-09-20T12:00', 1, 'before start_time'),
+        ('2008-09-20T12:00+00:00', '2008-09-20T13:00', 1, 'UTC offset'),
+    )
+    
+    for url in urls:
+        for start_time, end_time, step_size, reason in windows:
+            response = client.post(url, json={'start_time': start_time, 'end_time': end_time, 'step_size': step_size})
+            assert response.status_code == 400, (url, start_time, end_time, step_size)
+            assert reason in response.get_json()['error']
+
+def test_empty_window_yields_one_point():
+    """A window whose end equals its start propagates exactly that instant"""
+    client = backend.app.test_client()
+    satellite_id = client.post('/api/satellites', json={'name': 'ISS', 'tle': ISS_TLE}).get_json()['id']
+    body = {'start_time': '2008-09-20T12:00', 'end_time': '2008-09-20T12:00', 'step_size': 1}
+    
+    for url in (f'/api/satellites/{satellite_id}/propagate', f'/api/satellites/{satellite_id}/ground-track'):
+        response = client.post(url, json=body)
+        assert response.status_code == 200
+        assert response.get_json()['propagation_data']['times'] == ['2008-09-20T12:00:00']
+    
+    with client.post('/api/satellites/propagate-all', json=body) as response:
+        assert response.status_code == 200
+        for result in response.get_json()['propagation_results']:
+            assert result['propagation_data']['times'] == ['2008-09-20T12:00:00']
+
+def test_repeated_track_requests_revalidate_by_etag():
+    """A repeated /propagate or /ground-track POST with the same ETag gets an empty 304; other windows get other tags"""
+    client = backend.app.test_client()
+    satellite_id = client.post('/api/satellites', json={'name': 'ISS', 'tle': ISS_TLE}).get_json()['id']
+    body = {'start_time': '2008-09-20T12:00', 'end_time': '2008-09-20T18:00', 'step_size': 1}
+    
+    for url in (f'/api/satellites/{satellite_id}/propagate', f'/api/satellites/{satellite_id}/ground-track'):
+        first = client.post(url, json=body, headers={'Accept-Encoding': 'br'})
+        etag = first.headers['ETag']
+        assert first.status_code == 200 and etag.startswith('W/')
+        
+        # The tag is weak, so it still matches when the body is compressed differently
+        for accept_encoding in ('br', 'gzip', 'identity'):
+            repeat = client.post(url, json=body, headers={'If-None-Match': etag, 'Accept-Encoding': accept_encoding})
+            assert repeat.status_code == 304
+            assert repeat.data == b''
+            assert repeat.headers['ETag'] == etag
+        
+        # A different window or page is different content, so it must not match the cached tag
+        for change in ({'end_time': '2008-09-20T19:00'}, {'step_size': 2}, {'offset': 10}, {'limit': 10}, {'max_points': 50}):
+            other = client.post(url, json={**body, **change}, headers={'If-None-Match': etag})
+            assert other.status_code == 200, change
+            assert other.headers['ETag'] != etag
@@ -0,0 +1,6 @@
+"""WSGI entry point for servers that look for `application`
+
+Run from the backend directory, e.g. with threaded workers:
+    gunicorn -k gthread -w 4 --threads 8 wsgi:application
+"""
+from app import app as application